@@ -1,27 +1,61 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
 import os
+import queue
 import re
+import shutil
+import subprocess
 import sys
-import time
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, replace
+from typing import TYPE_CHECKING, Any, Iterator, List, NamedTuple, Optional, Protocol, Tuple
 
-import fitz  # pymupdf
-import pyttsx3
+# fitz, pypdfium2 and pyttsx3 are slow to import, so they are imported where first needed
+# rather than before the book-selection prompt
+if TYPE_CHECKING:
+    import fitz  # pymupdf
 
 
 BOOKS_DIR = "/Volumes/macStore/pythonProjects/PythonProject/PdfNarrator/Books"
 
-CHAPTER_PATTERNS = [
-    re.compile(r"^\s*(chapter)\s+([0-9]+|[ivxlcdm]+)\b\s*(.*)$", re.IGNORECASE),   # CHAPTER 1 / CHAPTER II
-    re.compile(r"^\s*(chapter)\s+([a-z]+)\b\s*(.*)$", re.IGNORECASE),             # CHAPTER ONE
-    re.compile(r"^\s*(ch\.?|chap\.?)\s*[-:]?\s*([0-9]+|[ivxlcdm]+)\b\s*(.*)$", re.IGNORECASE),  # CH. 1 / CHAP. 3
-]
+# Detected chapters are cached here, keyed by the PDF's SHA-256, the text backend and
+# CHAPTER_CACHE_VERSION. Bump the version whenever the detection heuristics change.
+CHAPTER_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pdfnarrator")
+CHAPTER_CACHE_VERSION = 2
+
+# Below this page count the process pool costs more than it saves
+PARALLEL_SCAN_MIN_PAGES = 32
+SCAN_CHUNKSIZE = 16
+
+# CHAPTER 1 / CHAPTER II / CHAPTER ONE / CH. 1 / CHAP. 3, fused into one pattern so each page
+# needs a single search instead of a regex call per line per pattern. [^\S\n] keeps every part
+# of a match on one line, like the old per-line patterns, and the lookahead skips lines longer
+# than 140 chars once stripped.
+COMBINED_CHAPTER_RE = re.compile(
+    r"(?im)^[^\S\n]*(?=[^\n]{0,139}\S[^\S\n]*$)(?:(?P<w1>chapter)[^\S\n]+(?P<lab1>[0-9]+|[ivxlcdm]+|[a-z]+)"
+    r"|(?P<w2>ch\.?|chap\.?)[^\S\n]*[-:]?[^\S\n]*(?P<lab2>[0-9]+|[ivxlcdm]+))\b[^\S\n]*(?P<title>[^\n]*)"
+)
+
+# Upper bound on pages kept in DocTextCache, so huge PDFs don't hold every page's text in memory
+PAGE_TEXT_CACHE_SIZE = 512
+
+# Chapter headings usually appear near the top of the page
+HEADING_SCAN_CHARS = 2048
+HEADING_SCAN_LINES = 25
+
+# Text blocks (fitz) that chapter scanning reads from the top of each page
+HEADING_BLOCKS = 3
 
 # If the TOC exists, we will treat these TOC entries as chapters when matched
 TOC_CHAPTER_HINT = re.compile(r"\bchapter\b|\bch\.\b|\bchap\.\b", re.IGNORECASE)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Chapter:
     label: str            # e.g., "1", "II", "One", or "TOC"
     title: str            # chapter title (if known)
@@ -30,35 +64,162 @@ class Chapter:
 
 
 def normalize_whitespace(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip()
+    # str.split() with no arguments collapses whitespace runs and trims, entirely in C
+    return " ".join(s.split())
 
 
 def list_pdf_files(folder: str) -> List[str]:
     if not os.path.isdir(folder):
         raise FileNotFoundError(f"Folder not found: {folder}")
 
-    pdfs = []
-    for name in os.listdir(folder):
-        if name.lower().endswith(".pdf"):
-            pdfs.append(os.path.join(folder, name))
-    return sorted(pdfs, key=lambda p: os.path.basename(p).lower())
+    # DirEntry caches name/path/type, so no extra stat or join per entry on slow volumes
+    with os.scandir(folder) as it:
+        pdfs = [e.path for e in it if e.name.lower().endswith(".pdf") and e.is_file()]
+    pdfs.sort(key=lambda p: os.path.basename(p).lower())
+    return pdfs
+
+
+@contextmanager
+def _number_completion(first: int, last: int) -> Iterator[None]:
+    """Tab-complete the numbers first..last at input() prompts inside the block, where readline exists."""
+    try:
+        import readline
+    except ImportError:  # Windows
+        yield
+        return
+    options = [str(n) for n in range(first, last + 1)]
+
+    def completer(text: str, state: int) -> Optional[str]:
+        matches = [o for o in options if o.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(completer)
+    if "libedit" in (readline.__doc__ or ""):  # macOS system Python
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+    try:
+        yield
+    finally:
+        # Don't offer stale numbers at later free-text prompts
+        readline.set_completer(None)
 
 
 def choose_from_list(items: List[str], prompt: str) -> int:
-    while True:
-        choice = input(prompt).strip()
-        if choice.isdigit():
-            idx = int(choice) - 1
+    with _number_completion(1, len(items)):
+        while True:
+            try:
+                idx = int(input(prompt)) - 1
+            except ValueError:
+                idx = -1
             if 0 <= idx < len(items):
                 return idx
-        print("Invalid selection. Please enter a number from the list.")
+            print("Invalid selection. Please enter a number from the list.")
+
+
+class TTSEngine(Protocol):
+    """The subset of pyttsx3.Engine used here; SayEngine implements the same calls."""
+
+    def getProperty(self, name: str) -> Any: ...
+    def setProperty(self, name: str, value: Any) -> None: ...
+    def say(self, text: str) -> None: ...
+    def runAndWait(self) -> None: ...
+
+
+class SayVoice(NamedTuple):
+    id: str
+    name: str
+    languages: List[str]
+
+
+# "Alex                en_US    # Most people recognize me by my voice."
+SAY_VOICE_LINE = re.compile(r"^(?P<name>.+?)\s+(?P<lang>[a-z]{2,3}[_-]\w+)\s+#")
+
+
+class SayEngine:
+    """
+    macOS TTS through the native `say` command. Each runAndWait() pipes every queued
+    utterance into one `say` process, so a page is spoken with continuous prosody and
+    without pyttsx3's per-utterance round trip through the Objective-C bridge.
+    """
+
+    def __init__(self, rate: Optional[int] = None, voice: Optional[str] = None):
+        self.rate = rate
+        self.voice = voice
+        self._queue: List[str] = []
+        self._voices: Optional[List[SayVoice]] = None
+
+    def _list_voices(self) -> List[SayVoice]:
+        if self._voices is None:
+            out = subprocess.run(["say", "-v", "?"], capture_output=True, text=True).stdout
+            self._voices = []
+            for line in out.splitlines():
+                m = SAY_VOICE_LINE.match(line)
+                if m:
+                    name = m.group("name").strip()
+                    self._voices.append(SayVoice(id=name, name=name, languages=[m.group("lang")]))
+        return self._voices
+
+    def getProperty(self, name: str) -> Any:
+        if name == "voices":
+            return self._list_voices()
+        if name == "voice":
+            return self.voice
+        if name == "rate":
+            return self.rate
+        raise KeyError(name)
+
+    def setProperty(self, name: str, value: Any) -> None:
+        if name == "voice":
+            self.voice = value
+        elif name == "rate":
+            self.rate = int(value)
+        else:
+            raise KeyError(name)
+
+    def say(self, text: str) -> None:
+        self._queue.append(text.rstrip())
+
+    def runAndWait(self) -> None:
+        text, self._queue = "\n".join(self._queue), []
+        if not text:
+            return
+        cmd = ["say", "-f", "-"]
+        if self.rate:
+            cmd += ["-r", str(self.rate)]
+        if self.voice:
+            cmd += ["-v", self.voice]
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, text=True)
+        try:
+            proc.communicate(text)
+        except BaseException:
+            # Ctrl+C mid-page: stop speaking immediately rather than leaving `say` running
+            proc.terminate()
+            proc.wait()
+            raise
+
+
+def _use_say_engine() -> bool:
+    return sys.platform == "darwin" and shutil.which("say") is not None
+
+
+def preload_tts() -> None:
+    """
+    Import pyttsx3 on a background thread so it overlaps with opening the book.
+    Only the import is done here: the engine itself must be created on the main thread.
+    """
+    if not _use_say_engine():
+        threading.Thread(target=__import__, args=("pyttsx3",), daemon=True).start()
 
 
-def init_tts() -> pyttsx3.Engine:
+def init_tts() -> TTSEngine:
+    if _use_say_engine():
+        return SayEngine()
+    import pyttsx3
     return pyttsx3.init()
 
 
-def list_voices(engine: pyttsx3.Engine) -> None:
+def list_voices(engine: TTSEngine) -> None:
     voices = engine.getProperty("voices")
     for i, v in enumerate(voices):
         name = getattr(v, "name", "Unknown")
@@ -67,7 +228,7 @@ def list_voices(engine: pyttsx3.Engine) -> None:
         print(f"[{i}] {name} | id={vid} | languages={langs}")
 
 
-def set_voice(engine: pyttsx3.Engine, voice_index: int) -> None:
+def set_voice(engine: TTSEngine, voice_index: int) -> None:
     voices = engine.getProperty("voices")
     if 0 <= voice_index < len(voices):
         engine.setProperty("voice", voices[voice_index].id)
@@ -76,32 +237,149 @@ def set_voice(engine: pyttsx3.Engine, voice_index: int) -> None:
         raise ValueError("Invalid voice index")
 
 
-def set_rate(engine: pyttsx3.Engine, rate: int) -> None:
+def set_rate(engine: TTSEngine, rate: int) -> None:
     engine.setProperty("rate", rate)
     print(f"Speech rate set to: {rate}")
 
 
-def page_text(doc: fitz.Document, page_index: int) -> str:
-    return doc[page_index].get_text("text") or ""
+class TextBackend(Protocol):
+    name: str  # part of the chapter cache key; backends find different heading text
+
+    def page_count(self) -> int: ...
+    def page_text(self, page_index: int) -> str: ...
+    def close(self) -> None: ...
+
+
+class FitzBackend:
+    name = "fitz"
+
+    def __init__(self, doc: fitz.Document, owns_doc: bool = False):
+        self.doc = doc
+        self.owns_doc = owns_doc
+
+    def page_count(self) -> int:
+        return len(self.doc)
+
+    def page_text(self, page_index: int) -> str:
+        return self.doc[page_index].get_text("text") or ""
+
+    def heading_text(self, page_index: int) -> str:
+        # Chapter headings sit in the first few text blocks; skip image blocks (type 1)
+        blocks = [b for b in self.doc[page_index].get_text("blocks") if b[6] == 0]
+        return "\n".join(b[4] for b in blocks[:HEADING_BLOCKS])
+
+    def close(self) -> None:
+        if self.owns_doc:
+            self.doc.close()
+
+
+class PdfiumBackend:
+    name = "pdfium"
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        # pdfium ends lines with "\r\n" and marks hyphenation and unmapped glyphs with U+FFFE;
+        # rejoin hyphenated words and drop the marker so the text matches what fitz returns
+        text = text.replace("\ufffe\r\n", "").replace("\r\n", "\n")
+        return text.replace("\ufffe", "")
+
+    def __init__(self, pdf_path: str):
+        import pypdfium2 as pdfium
+        self._doc = pdfium.PdfDocument(pdf_path)
+
+    def page_count(self) -> int:
+        return len(self._doc)
+
+    def page_text(self, page_index: int) -> str:
+        page = self._doc[page_index]
+        textpage = page.get_textpage()
+        try:
+            return self._normalize(textpage.get_text_range() or "")
+        finally:
+            textpage.close()
+            page.close()
+
+    def close(self) -> None:
+        self._doc.close()
+
+
+def open_text_backend(pdf_path: str, doc: Optional[fitz.Document] = None,
+                      name: Optional[str] = None) -> TextBackend:
+    """
+    Text extraction uses pypdfium2 when it is installed and falls back to PyMuPDF,
+    also for files pdfium rejects (MuPDF repairs many damaged PDFs).
+    The fitz document is still needed for the TOC either way.
+    Pass name="fitz" to skip pdfium, e.g. so scan workers match the parent's backend.
+    """
+    pdfium = None
+    if name != FitzBackend.name:
+        try:
+            import pypdfium2 as pdfium
+        except ImportError:
+            pass
+    if pdfium is not None:
+        try:
+            return PdfiumBackend(pdf_path)
+        except pdfium.PdfiumError:
+            pass
+    if doc is not None:
+        return FitzBackend(doc)
+    import fitz
+    return FitzBackend(fitz.open(pdf_path), owns_doc=True)
+
+
+def page_text(backend: TextBackend, page_index: int) -> str:
+    return backend.page_text(page_index)
+
+
+class DocTextCache:
+    """
+    LRU cache of extracted page text, so a page is extracted once even when it is
+    read by chapter scanning and then prefetched, repeated or revisited during narration.
+    """
+
+    def __init__(self, backend: TextBackend, max_pages: int = PAGE_TEXT_CACHE_SIZE):
+        self.backend = backend
+        self.max_pages = max_pages
+        self._c: "OrderedDict[int, str]" = OrderedDict()
+        # Neither MuPDF nor pdfium documents are thread-safe; the narration prefetch thread shares this cache
+        self._lock = threading.Lock()
+
+    def get(self, page_index: int) -> str:
+        with self._lock:
+            v = self._c.get(page_index)
+            if v is not None:
+                self._c.move_to_end(page_index)
+                return v
+            v = page_text(self.backend, page_index)
+            self._c[page_index] = v
+            if len(self._c) > self.max_pages:
+                self._c.popitem(last=False)
+            return v
+
+
+def _head_lines(text: str, n: int = HEADING_SCAN_LINES) -> str:
+    """The prefix of text that holds its first n non-empty lines."""
+    pos = 0
+    while n:
+        nl = text.find("\n", pos)
+        if nl == -1:
+            return text
+        if not text[pos:nl].isspace() and nl > pos:
+            n -= 1
+        pos = nl + 1
+    return text[:pos]
 
 
 def find_chapter_heading_on_page(text: str) -> Optional[Tuple[str, str]]:
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-    if not lines:
+    m = COMBINED_CHAPTER_RE.search(_head_lines(text))
+    if not m:
         return None
 
-    scan_lines = lines[:25]  # chapter headings usually appear near the top
-    for ln in scan_lines:
-        if len(ln) > 140:
-            continue
-        for pat in CHAPTER_PATTERNS:
-            m = pat.match(ln)
-            if m:
-                label = normalize_whitespace(m.group(2))
-                title = normalize_whitespace(m.group(3) if m.lastindex and m.lastindex >= 3 else "")
-                title = re.sub(r"^[-:–—]+\s*", "", title).strip()
-                return label, title
-    return None
+    label = normalize_whitespace(m.group("lab1") or m.group("lab2"))
+    title = normalize_whitespace(m.group("title") or "")
+    title = re.sub(r"^[-:–—]+\s*", "", title).strip()
+    return label, title
 
 
 def chapters_from_toc(doc: fitz.Document) -> List[Chapter]:
@@ -122,46 +400,84 @@ def chapters_from_toc(doc: fitz.Document) -> List[Chapter]:
     else:
         entries = [(lvl, title, page) for (lvl, title, page) in toc if lvl == 1]
 
-    # Convert to start pages (0-based), merge duplicates, sort by page
-    starts = []
-    seen_pages = set()
-    for lvl, title, page1 in entries:
-        if not page1:
-            continue
-        start0 = max(0, min(int(page1) - 1, len(doc) - 1))
-        if start0 in seen_pages:
-            continue
-        seen_pages.add(start0)
-        starts.append((start0, normalize_whitespace(title or "")))
-
-    starts.sort(key=lambda x: x[0])
-    if not starts:
-        return []
+    # Convert to start pages (0-based) and sort by page; the sort is stable, so among
+    # entries on the same page the first one in TOC order is kept
+    last_page = len(doc) - 1
+    starts = sorted(
+        ((max(0, min(int(page1) - 1, last_page)), title) for lvl, title, page1 in entries if page1),
+        key=lambda x: x[0],
+    )
 
+    # Single pass: drop duplicate start pages and close the previous chapter's range
     chapters: List[Chapter] = []
-    for i, (sp, title) in enumerate(starts):
-        ep = (starts[i + 1][0] - 1) if (i + 1 < len(starts)) else (len(doc) - 1)
-        label = "TOC"
-        chapters.append(Chapter(label=label, title=title, start_page=sp, end_page=max(sp, ep)))
+    for sp, title in starts:
+        if chapters:
+            if sp <= chapters[-1].start_page:
+                continue
+            chapters[-1] = replace(chapters[-1], end_page=sp - 1)
+        chapters.append(Chapter(label="TOC", title=normalize_whitespace(title or ""), start_page=sp, end_page=last_page))
+    return chapters
+
 
-    # Remove tiny / bogus ranges (e.g., consecutive TOC entries on same page)
-    filtered = []
-    last_sp = -9999
-    for ch in chapters:
-        if ch.start_page - last_sp >= 1:
-            filtered.append(ch)
-            last_sp = ch.start_page
-    return filtered
+def scan_text(backend: TextBackend, page_index: int, cache: Optional[DocTextCache] = None) -> str:
+    """
+    Text that chapter scanning searches for a heading. fitz reads just the top text blocks,
+    which gives more accurate headings; other backends use the head of the page text, taken
+    from the cache when there is one so narration can reuse it.
+    """
+    if isinstance(backend, FitzBackend):
+        return backend.heading_text(page_index)
+    txt = cache.get(page_index) if cache is not None else backend.page_text(page_index)
+    return txt[:HEADING_SCAN_CHARS]
+
+
+# Per-process text backend used by the parallel scan workers
+_worker_backend: Optional[TextBackend] = None
+
+
+def _scan_worker_init(pdf_path: str, backend_name: str) -> None:
+    global _worker_backend
+    _worker_backend = open_text_backend(pdf_path, name=backend_name)
 
 
-def chapters_by_scanning(doc: fitz.Document) -> List[Chapter]:
+def _scan_worker(page_index: int) -> Tuple[int, Optional[Tuple[str, str]]]:
+    return page_index, find_chapter_heading_on_page(scan_text(_worker_backend, page_index))
+
+
+def _scan_pages_sequential(cache: DocTextCache) -> List[Tuple[int, str, str]]:
     hits = []
-    for i in range(len(doc)):
-        txt = page_text(doc, i)
+    for i in range(cache.backend.page_count()):
+        txt = scan_text(cache.backend, i, cache)
         hit = find_chapter_heading_on_page(txt)
         if hit:
             label, title = hit
             hits.append((i, label, title))
+    return hits
+
+
+def _scan_pages_parallel(pdf_path: str, backend_name: str, page_count: int) -> List[Tuple[int, str, str]]:
+    """
+    MuPDF text extraction is CPU-bound and holds a global lock, so threads don't help.
+    Each worker process opens its own handle to the PDF, with the same backend as the
+    caller, and scans pages independently.
+    """
+    hits = []
+    with multiprocessing.Pool(initializer=_scan_worker_init, initargs=(pdf_path, backend_name)) as pool:
+        for i, hit in pool.imap_unordered(_scan_worker, range(page_count), chunksize=SCAN_CHUNKSIZE):
+            if hit:
+                label, title = hit
+                hits.append((i, label, title))
+    hits.sort(key=lambda h: h[0])
+    return hits
+
+
+def chapters_by_scanning(cache: DocTextCache, pdf_path: Optional[str] = None) -> List[Chapter]:
+    backend = cache.backend
+    page_count = backend.page_count()
+    if pdf_path and page_count >= PARALLEL_SCAN_MIN_PAGES:
+        hits = _scan_pages_parallel(pdf_path, backend.name, page_count)
+    else:
+        hits = _scan_pages_sequential(cache)
 
     if not hits:
         return []
@@ -176,72 +492,178 @@ def chapters_by_scanning(doc: fitz.Document) -> List[Chapter]:
 
     chapters: List[Chapter] = []
     for idx, (sp, label, title) in enumerate(dedup):
-        ep = (dedup[idx + 1][0] - 1) if (idx + 1 < len(dedup)) else (len(doc) - 1)
+        ep = (dedup[idx + 1][0] - 1) if (idx + 1 < len(dedup)) else (page_count - 1)
         chapters.append(Chapter(label=label, title=title, start_page=sp, end_page=max(sp, ep)))
 
     return chapters
 
 
-def detect_chapters(doc: fitz.Document) -> List[Chapter]:
+def _pdf_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+        return h.hexdigest()
+
+
+def _load_cached_chapters(cache_path: str) -> Optional[List[Chapter]]:
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return [Chapter(**d) for d in json.load(f)]
+    except (OSError, ValueError, TypeError):
+        return None  # missing, unreadable or stale cache file; detect again and overwrite it
+
+
+def _save_cached_chapters(cache_path: str, chapters: List[Chapter]) -> None:
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump([asdict(c) for c in chapters], f)
+    except OSError:
+        pass  # caching is best-effort
+
+
+def _detect_chapters_uncached(doc: fitz.Document, cache: DocTextCache, pdf_path: Optional[str]) -> List[Chapter]:
     # 1) Try TOC
     toc_ch = chapters_from_toc(doc)
     if toc_ch:
         return toc_ch
 
     # 2) Fallback to scanning pages
-    scan_ch = chapters_by_scanning(doc)
+    scan_ch = chapters_by_scanning(cache, pdf_path)
     return scan_ch
 
 
-def chunk_text_for_speaking(text: str, max_chars: int = 900) -> List[str]:
-    paragraphs = [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
-    chunks: List[str] = []
-    for p in paragraphs:
-        p = normalize_whitespace(p)
-        if len(p) <= max_chars:
-            chunks.append(p)
-        else:
-            parts = re.split(r"(?<=[.!?])\s+", p)
-            buf = ""
-            for part in parts:
-                part = part.strip()
-                if not part:
-                    continue
-                if len(buf) + len(part) + 1 <= max_chars:
-                    buf = (buf + " " + part).strip()
-                else:
-                    if buf:
-                        chunks.append(buf)
-                    buf = part
-            if buf:
-                chunks.append(buf)
-    return chunks
+def detect_chapters(doc: fitz.Document, cache: DocTextCache, pdf_path: Optional[str] = None) -> List[Chapter]:
+    if not pdf_path:
+        return _detect_chapters_uncached(doc, cache, pdf_path)
 
+    cache_name = f"{_pdf_digest(pdf_path)}.v{CHAPTER_CACHE_VERSION}.{cache.backend.name}.json"
+    cache_path = os.path.join(CHAPTER_CACHE_DIR, cache_name)
+    chapters = _load_cached_chapters(cache_path)
+    if chapters is None:
+        chapters = _detect_chapters_uncached(doc, cache, pdf_path)
+        _save_cached_chapters(cache_path, chapters)
+    return chapters
 
-def speak_text(engine: pyttsx3.Engine, text: str) -> None:
-    t = normalize_whitespace(text)
-    if not t:
-        return
-    engine.say(t)
-    engine.runAndWait()
 
+# Candidate sentence ends: terminal punctuation followed by whitespace, or a blank line (paragraph break)
+SENTENCE_BOUNDARY_RE = re.compile(r"[.!?]+(?=\s|$)|\n[^\S\n]*\n")
 
-def narrate_pages(doc: fitz.Document, engine: pyttsx3.Engine, start_page: int, end_page: int) -> None:
+# Words ending in "." that don't end a sentence
+ABBREVIATIONS = {"mr.", "mrs.", "ms.", "dr.", "st.", "jr.", "sr.", "vs.", "etc.", "e.g.", "i.e."}
+
+MIN_SENTENCE_CHARS = 10
+
+
+def iter_sentences(text: str, min_chars: int = MIN_SENTENCE_CHARS) -> Iterator[str]:
+    """
+    Yield speakable sentences from page text as soon as each one is complete.
+    Decimals ("3.5") never match a boundary; abbreviations and fragments shorter
+    than min_chars are merged into the following sentence. Paragraph breaks always
+    end a sentence, so headings without punctuation are spoken on their own.
+    """
+    start = 0
+    for m in SENTENCE_BOUNDARY_RE.finditer(text):
+        end = m.end()
+        paragraph_break = not m.group().strip()
+        if not paragraph_break:
+            words = text[start:end].split()
+            if words and words[-1].lower() in ABBREVIATIONS:
+                continue
+            if len(normalize_whitespace(text[start:end])) < min_chars:
+                continue
+        sentence = normalize_whitespace(text[start:end])
+        start = end
+        if sentence:
+            yield sentence
+    tail = normalize_whitespace(text[start:])
+    if tail:
+        yield tail
+
+
+def prepare_page(cache: DocTextCache, page_index: int) -> Tuple[str, List[str]]:
+    txt = cache.get(page_index).strip()
+    return txt, (list(iter_sentences(txt)) if txt else [])
+
+
+class PagePrefetcher:
+    """
+    Extracts and splits upcoming pages into sentences on a background thread,
+    so the next page is ready by the time the current one has been spoken.
+    """
+
+    def __init__(self, cache: DocTextCache):
+        self.cache = cache
+        self._requests: "queue.Queue[Optional[int]]" = queue.Queue()
+        self._results: "queue.Queue[Tuple[int, Optional[Tuple[str, List[str]]]]]" = queue.Queue(maxsize=2)
+        self._pending = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            page_index = self._requests.get()
+            if page_index is None:
+                return
+            try:
+                prepared = prepare_page(self.cache, page_index)
+            except Exception:
+                prepared = None  # take() redoes the work on the caller's thread and surfaces the error
+            self._results.put((page_index, prepared))
+
+    def prefetch(self, page_index: int) -> None:
+        self._pending += 1
+        self._requests.put(page_index)
+
+    def take(self, page_index: int) -> Tuple[str, List[str]]:
+        # Drain everything outstanding; results for other pages (after b/g/r) are discarded
+        prepared = None
+        while self._pending:
+            idx, result = self._results.get()
+            self._pending -= 1
+            if idx == page_index and result is not None:
+                prepared = result
+        if prepared is None:
+            prepared = prepare_page(self.cache, page_index)
+        return prepared
+
+    def close(self) -> None:
+        # Wait for any in-flight extraction so none can touch the backend after it is closed
+        self._requests.put(None)
+        self._thread.join()
+
+
+def narrate_pages(cache: DocTextCache, engine: TTSEngine, start_page: int, end_page: int) -> None:
+    page_count = cache.backend.page_count()
+    prefetcher = PagePrefetcher(cache)
+    try:
+        _narrate_loop(page_count, prefetcher, engine, start_page, end_page)
+    finally:
+        prefetcher.close()
+
+
+def _narrate_loop(page_count: int, prefetcher: PagePrefetcher, engine: TTSEngine,
+                  start_page: int, end_page: int) -> None:
     page = start_page
     while page <= end_page:
-        txt = page_text(doc, page).strip()
+        txt, sentences = prefetcher.take(page)
+        if page + 1 <= end_page:
+            prefetcher.prefetch(page + 1)
 
         print("\n" + "-" * 90)
-        print(f"NARRATING PAGE {page + 1}/{len(doc)}   (range: {start_page + 1}-{end_page + 1})")
+        print(f"NARRATING PAGE {page + 1}/{page_count}   (range: {start_page + 1}-{end_page + 1})")
         print("-" * 90)
 
         if not txt:
             print("(No readable text on this page.)")
         else:
-            chunks = chunk_text_for_speaking(txt)
-            for chunk in chunks:
-                speak_text(engine, chunk)
-                time.sleep(0.03)
+            # Queue the whole page and drain it with a single event-loop run
+            for sentence in sentences:
+                engine.say(sentence)
+            engine.runAndWait()
 
         print("\nControls: [Enter]=next page | b=back | r=repeat | g=go to page | q=stop")
         cmd = input("> ").strip().lower()
@@ -253,15 +675,16 @@ def narrate_pages(doc: fitz.Document, engine: pyttsx3.Engine, start_page: int, e
         elif cmd == "r":
             continue
         elif cmd == "g":
-            val = input(f"Go to page number (1-based, {start_page + 1}-{end_page + 1}): ").strip()
-            if val.isdigit():
-                target = int(val) - 1
+            try:
+                with _number_completion(start_page + 1, end_page + 1):
+                    target = int(input(f"Go to page number (1-based, {start_page + 1}-{end_page + 1}): ")) - 1
+            except ValueError:
+                print("Invalid page number.")
+            else:
                 if start_page <= target <= end_page:
                     page = target
                 else:
                     print("Out of range.")
-            else:
-                print("Invalid page number.")
         elif cmd == "q":
             break
         else:
@@ -283,8 +706,12 @@ def main():
     book_idx = choose_from_list(pdfs, "\nSelect a book (number): ")
     pdf_path = pdfs[book_idx]
     print(f"\nOpening: {os.path.basename(pdf_path)}")
+    preload_tts()
 
+    import fitz
     doc = fitz.open(pdf_path)
+    backend = open_text_backend(pdf_path, doc)
+    cache = DocTextCache(backend)
 
     # Setup TTS
     engine = init_tts()
@@ -304,7 +731,7 @@ def main():
 
     # Detect chapters
     print("\nDetecting chapters...")
-    chapters = detect_chapters(doc)
+    chapters = detect_chapters(doc, cache, pdf_path)
 
     if not chapters:
         print("\nNo chapters detected automatically.")
@@ -315,6 +742,7 @@ def main():
         ep = input(f"End page (1-{len(doc)}): ").strip()
         if not (sp.isdigit() and ep.isdigit()):
             print("Invalid page numbers.")
+            backend.close()
             doc.close()
             return
 
@@ -323,7 +751,8 @@ def main():
         if end_page < start_page:
             start_page, end_page = end_page, start_page
 
-        narrate_pages(doc, engine, start_page, end_page)
+        narrate_pages(cache, engine, start_page, end_page)
+        backend.close()
         doc.close()
         return
 
@@ -341,7 +770,8 @@ def main():
     if ch.title:
         print(f"  Title: {ch.title}")
 
-    narrate_pages(doc, engine, ch.start_page, ch.end_page)
+    narrate_pages(cache, engine, ch.start_page, ch.end_page)
+    backend.close()
     doc.close()
 
 